@@ -267,4 +267,36 @@ def get_filename_prefix(target_app):
             return '(TG-R) '
         case TargetApp.SONARR:
             return '(TG-S) '
-    return '(TG) '
\ No newline at end of file
+    return '(TG) '
+
+def index_by_name(entries):
+    """Map named entries (custom formats, qualities, ...) by name, keeping the first of any duplicates."""
+    indexed = {}
+    for entry in entries or []:
+        indexed.setdefault(entry['name'], entry)
+    return indexed
+
+def merge_named_entries(generated_entries, existing_entries):
+    """Merge entries from an existing file into generated ones, generated entries win on name clashes."""
+    merged = index_by_name(existing_entries)
+    merged.update(index_by_name(generated_entries))
+    return list(merged.values())
+
+def split_common_entries(first_entries, second_entries):
+    """Split two named entry lists into (common, first only, second only, conflicts).
+
+    An entry is common when both lists hold an identical entry under the same name.
+    Names present in both lists with different values (e.g. a different score per app)
+    are returned as conflicts, mapped to both entries, and stay in their own lists.
+    """
+    first = index_by_name(first_entries)
+    second = index_by_name(second_entries)
+
+    shared_names = first.keys() & second.keys()
+    conflicts = {name: (first[name], second[name]) for name in shared_names if first[name] != second[name]}
+    common_names = shared_names - conflicts.keys()
+
+    common = [entry for name, entry in first.items() if name in common_names]
+    first_only = [entry for name, entry in first.items() if name not in common_names]
+    second_only = [entry for name, entry in second.items() if name not in common_names]
+    return common, first_only, second_only, conflicts
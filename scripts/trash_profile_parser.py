@@ -84,17 +84,23 @@ def write_quality_profile_file(quality_profile):
         with open(PROFILE_PATH / f"{quality_profile['name']}.yml", 'r+') as quality_profile_file:
             quality_profile_data = yaml.safe_load(quality_profile_file)
 
-            # Merge non-empty lists from the original file into the new one
-            if quality_profile_data.get('custom_formats_sonarr', {}) and not quality_profile['custom_formats_sonarr']:
-                quality_profile['custom_formats_sonarr'] += [x for x in quality_profile_data['custom_formats_sonarr'] if x not in quality_profile['custom_formats_sonarr']]
-            if quality_profile_data.get('custom_formats_radarr', {}) and not quality_profile['custom_formats_radarr']:
-                quality_profile['custom_formats_radarr'] += [x for x in quality_profile_data['custom_formats_radarr'] if x not in quality_profile['custom_formats_radarr']]
+            # Restore the other app's formats from the original file
+            # Common formats in the file belong to both apps, so fold them back in before splitting again
+            existing_common_formats = quality_profile_data.get('custom_formats') or []
+            for app_formats_key in ('custom_formats_radarr', 'custom_formats_sonarr'):
+                existing_app_formats = quality_profile_data.get(app_formats_key) or []
+                if (existing_app_formats or existing_common_formats) and not quality_profile[app_formats_key]:
+                    quality_profile[app_formats_key] = merge_named_entries(existing_app_formats, existing_common_formats)
 
             # Find commonalities between the app-specific custom formats and merge them
-            common_custom_formats = [x for x in quality_profile['custom_formats_sonarr'] if x in quality_profile['custom_formats_radarr']]
-            quality_profile['custom_formats'] += [x for x in common_custom_formats if x not in quality_profile['custom_formats']]
-            quality_profile['custom_formats_radarr'] = [x for x in quality_profile['custom_formats_radarr'] if x not in quality_profile['custom_formats']]
-            quality_profile['custom_formats_sonarr'] = [x for x in quality_profile['custom_formats_sonarr'] if x not in quality_profile['custom_formats']]
+            common_custom_formats, radarr_custom_formats, sonarr_custom_formats, conflicts = split_common_entries(
+                quality_profile['custom_formats_radarr'],
+                quality_profile['custom_formats_sonarr'])
+            quality_profile['custom_formats'] = merge_named_entries(common_custom_formats, quality_profile['custom_formats'])
+            quality_profile['custom_formats_radarr'] = radarr_custom_formats
+            quality_profile['custom_formats_sonarr'] = sonarr_custom_formats
+            for custom_format_name, (radarr_entry, sonarr_entry) in sorted(conflicts.items()):
+                print(Fore.YELLOW + f"Conflict in {quality_profile['name']}: {custom_format_name} - RADARR: {radarr_entry} SONARR: {sonarr_entry}")
             print(Fore.CYAN + f"Found formats - RADARR: {len(quality_profile['custom_formats_radarr'])} SONARR: {len(quality_profile['custom_formats_sonarr'])} COMMON: {len(quality_profile['custom_formats'])}")
 
             # Re-save the file